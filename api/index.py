@@ -1,146 +1,596 @@
-from flask import Flask, request, jsonify
+from flask import Flask, request, Response
 from flask_cors import CORS
+import asyncio
+import functools
+import hashlib
+import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
+from logging.handlers import QueueHandler, QueueListener
 import os
+import queue
+import re
+import threading
+import types
+import weakref
+
+# pyahocorasick is a C-implemented multi-pattern matcher; fall back to a
+# plain Python scan if it isn't available
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# httpx powers the async outbound path; fall back to the sync session if
+# it isn't available
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# orjson is a C extension ~3-5x faster than stdlib json on encode/decode;
+# fall back to the stdlib if it isn't available
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# cachetools adds a TTL so a poisoned upstream translation ages out
+# instead of sticking for the process lifetime; fall back to lru_cache
+try:
+    from cachetools import TTLCache, cached
+    from cachetools.keys import hashkey
+except ImportError:
+    TTLCache = None
+
+def _dumps(obj):
+    """Serialize to JSON bytes using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
 
 # Initialize Flask app
 app = Flask(__name__)
 CORS(app, origins=['*'])
 
-# Configure logging
+# Configure logging - records are handed to a queue so formatting and the
+# stderr write happen on a background thread instead of the request path
 logging.basicConfig(level=logging.INFO)
+_LOG_QUEUE = queue.SimpleQueue()
+app.logger.addHandler(QueueHandler(_LOG_QUEUE))
+app.logger.propagate = False
+_LOG_LISTENER = QueueListener(_LOG_QUEUE, logging.StreamHandler())
+_LOG_LISTENER.start()
+
+# HTTP sessions are kept thread-local (greenlet-local under gevent monkey
+# patching) so pooled TCP+TLS connections to MyMemory are reused across
+# requests without sharing one Session between concurrent greenlets
+_SESSION_LOCAL = threading.local()
+
+def _get_session():
+    """Return the pooled Session for the current thread/greenlet"""
+    session = getattr(_SESSION_LOCAL, 'session', None)
+    if session is None:
+        session = requests.Session()
+        session.headers['User-Agent'] = 'translation-app/1.0'
+        session.mount('https://', HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=2, backoff_factor=0.1)
+        ))
+        _SESSION_LOCAL.session = session
+    return session
+
+# Upstream timeout counter - logged so the abort rate is observable
+_UPSTREAM_TIMEOUTS = 0
+
+def _note_upstream_timeout():
+    """Count an aborted upstream call and log the running total"""
+    global _UPSTREAM_TIMEOUTS
+    _UPSTREAM_TIMEOUTS += 1
+    app.logger.warning(f"Upstream translation timed out (total aborts: {_UPSTREAM_TIMEOUTS})")
+
+def _is_timeout(exc):
+    """True for any of the timeout exception families the clients raise"""
+    if isinstance(exc, (TimeoutError, requests.Timeout)):
+        return True
+    return httpx is not None and isinstance(exc, httpx.TimeoutException)
+
+# Async clients are kept per event loop: under plain WSGI (dev server,
+# sync gunicorn workers, Vercel) Flask spins up a fresh loop for every
+# async view call, and a keep-alive connection pooled on a closed loop
+# kills the next request with "Event loop is closed". Under ASGI there is
+# one long-lived loop, so this still amortizes to a single shared client.
+_ASYNC_CLIENTS = weakref.WeakKeyDictionary()
+_ASYNC_BROKEN = False
+
+def _get_async_client():
+    """Return the AsyncClient bound to the running loop, or None when no
+    usable async transport exists (httpx missing, or broken by gevent)"""
+    global _ASYNC_BROKEN
+    if httpx is None or _ASYNC_BROKEN:
+        return None
+    loop = asyncio.get_running_loop()
+    client = _ASYNC_CLIENTS.get(loop)
+    if client is None:
+        try:
+            client = httpx.AsyncClient(
+                timeout=httpx.Timeout(4.0, connect=3.0),
+                limits=httpx.Limits(max_connections=100),
+                headers={'User-Agent': 'translation-app/1.0'}
+            )
+        except Exception:
+            # e.g. gevent monkey patching can break the async transport;
+            # the greenlet-friendly sync session covers that deployment
+            _ASYNC_BROKEN = True
+            app.logger.warning("Async HTTP transport unavailable; falling back to the sync session")
+            return None
+        _ASYNC_CLIENTS[loop] = client
+    return client
+
+# Pre-assembled template for the single-translation success response: the
+# shape is fixed, so only the variable fields are JSON-encoded per request
+# and the dict -> serializer round-trip is skipped entirely
+_TRANSLATE_RESP_TMPL = (
+    '{{"status":200,"message":"Translation successful","data":{{'
+    '"original_text":{original_text},"translated_text":{translated_text},'
+    '"source_language":{{"code":{source_code},"name":{source_name}}},'
+    '"target_language":{{"code":{target_code},"name":{target_name}}},'
+    '"confidence":{confidence},'
+    '"service":"MyMemory API with fallback",'
+    '"note":"Using hybrid translation service for demo purposes"}}}}'
+)
 
 def make_response(status, message, data):
     """Helper function to create consistent API responses"""
-    return jsonify({
+    body = _dumps({
         "status": status,
         "message": message,
         "data": data
-    }), status
+    })
+    return Response(body, status=status, mimetype='application/json')
 
 # Translation function using MyMemory API (free) with fallback
 def translate_text(text, target_lang, source_lang='auto'):
     """Translate text using MyMemory Translation API with fallback"""
+    # Prepare language pair - MyMemory doesn't support 'auto', so detect or use 'en'
+    if source_lang == 'auto':
+        source_lang = 'en'  # Default to English if auto-detect
+
+    # Normalize for the cache key and the known-phrase gate only; the
+    # original-cased text is what actually goes upstream
+    text_norm = text.strip().lower()
+
+    # Known-phrase gate: answer from the local dictionary without paying
+    # the MyMemory round-trip
+    if _dictionary_covers(text_norm, target_lang):
+        translated, confidence = simple_translate(text_norm, target_lang), 0.9
+    else:
+        translated, confidence = _translate_cached(text.strip(), source_lang, target_lang)
+
+    return {
+        'translated_text': translated,
+        'source_lang': source_lang,
+        'target_lang': target_lang,
+        'confidence': confidence
+    }
+
+# Size-bounded, hour-TTL cache for the network-backed core; entries expire
+# so a bad upstream result cannot stick forever
+_CACHE_LOCK = threading.RLock()
+if TTLCache is not None:
+    _TRANSLATE_CACHE = TTLCache(maxsize=10_000, ttl=3600)
+    # Only the key is normalized; the cached function still sees (and
+    # sends upstream) the caller's original casing
+    _cache_translations = cached(
+        cache=_TRANSLATE_CACHE, lock=_CACHE_LOCK, info=True,
+        key=lambda text, source_lang, target_lang: hashkey(text.strip().lower(), source_lang, target_lang)
+    )
+else:
+    # lru_cache has no key function, so case variants cache separately here
+    _TRANSLATE_CACHE = None
+    _cache_translations = functools.lru_cache(maxsize=4096)
+
+@_cache_translations
+def _translate_cached(text, source_lang, target_lang):
+    """Cached translation core - repeat (text, source, target) lookups skip
+    the MyMemory round-trip entirely and hit the in-process cache"""
     try:
         # MyMemory API endpoint
         url = "https://api.mymemory.translated.net/get"
-        
-        # Prepare language pair - MyMemory doesn't support 'auto', so detect or use 'en'
-        if source_lang == 'auto':
-            source_lang = 'en'  # Default to English if auto-detect
-        
+
         lang_pair = f'{source_lang}|{target_lang}'
-        
+
         # Make request
         params = {
             'q': text,
             'langpair': lang_pair
         }
-        
-        response = requests.get(url, params=params, timeout=10)
+
+        # Split connect/read budget: fail a dead host fast, cap slow reads
+        response = _get_session().get(url, params=params, timeout=(3.05, 4))
         response.raise_for_status()
-        
-        data = response.json()
-        
+
+        # Decode the raw bytes with orjson, skipping requests' charset
+        # sniffing and the stdlib parser
+        data = orjson.loads(response.content) if orjson is not None else response.json()
+
         if data.get('responseStatus') == 200:
             translated = data['responseData']['translatedText']
-            # If translation is the same as original, try a simple dictionary approach
-            if translated.lower() == text.lower():
+            # If translation is the same as original, try a simple dictionary
+            # approach; casefold() handles Unicode properly and the length
+            # check skips both folds when the strings can't be equal anyway
+            if len(translated) == len(text) and translated.casefold() == text.casefold():
                 translated = simple_translate(text, target_lang)
-            
-            return {
-                'translated_text': translated,
-                'source_lang': source_lang,
-                'target_lang': target_lang,
-                'confidence': 0.8
-            }
+
+            return translated, 0.8
         else:
             # Fallback to simple translation
-            return {
-                'translated_text': simple_translate(text, target_lang),
-                'source_lang': source_lang,
-                'target_lang': target_lang,
-                'confidence': 0.6
-            }
-            
+            return simple_translate(text, target_lang), 0.6
+
     except Exception as e:
+        if _is_timeout(e):
+            _note_upstream_timeout()
         # Ultimate fallback to simple translation
-        return {
-            'translated_text': simple_translate(text, target_lang),
+        return simple_translate(text, target_lang), 0.5
+
+async def translate_text_async(text, target_lang, source_lang='auto'):
+    """Async twin of translate_text using the shared httpx client"""
+    if source_lang == 'auto':
+        source_lang = 'en'  # Default to English if auto-detect
+
+    # Normalized for the gate and memo key only; the original-cased text
+    # is what actually goes upstream
+    text_norm = text.strip().lower()
+
+    # Known-phrase gate: answer from the local dictionary without paying
+    # the MyMemory round-trip
+    if _dictionary_covers(text_norm, target_lang):
+        translated, confidence = simple_translate(text_norm, target_lang), 0.9
+    else:
+        translated, confidence = await _translate_cached_async(text.strip(), source_lang, target_lang)
+
+    return {
+        'translated_text': translated,
+        'source_lang': source_lang,
+        'target_lang': target_lang,
+        'confidence': confidence
+    }
+
+# Manual memo for the async path (functools.lru_cache doesn't await);
+# same TTL policy as the sync cache when cachetools is available
+if TTLCache is not None:
+    _ASYNC_CACHE = TTLCache(maxsize=10_000, ttl=3600)
+else:
+    _ASYNC_CACHE = {}
+
+def _async_cache_get(key):
+    """Locked read - TTLCache evicts expired entries even on lookup, so
+    reads mutate the cache and need the lock just like writes"""
+    with _CACHE_LOCK:
+        return _ASYNC_CACHE.get(key)
+
+def _async_cache_put(key, result):
+    """Store an async-path result; TTLCache evicts on its own, the plain
+    dict fallback is bounded manually"""
+    with _CACHE_LOCK:
+        if TTLCache is None and len(_ASYNC_CACHE) >= 4096:
+            # Drop the oldest entry to keep the memo bounded
+            _ASYNC_CACHE.pop(next(iter(_ASYNC_CACHE)))
+        _ASYNC_CACHE[key] = result
+
+async def _translate_cached_async(text, source_lang, target_lang):
+    """Cached async translation core - same semantics as _translate_cached"""
+    # Memo key is normalized; `text` keeps its original casing for upstream
+    key = (text.strip().lower(), source_lang, target_lang)
+    cached = _async_cache_get(key)
+    if cached is not None:
+        return cached
+
+    try:
+        url = "https://api.mymemory.translated.net/get"
+        params = {
+            'q': text,
+            'langpair': f'{source_lang}|{target_lang}'
+        }
+
+        client = _get_async_client()
+        if client is None:
+            # No usable async transport on this loop - pooled sync session
+            response = _get_session().get(url, params=params, timeout=(3.05, 4))
+        else:
+            # Soft deadline on top of the client timeouts so a slow upstream
+            # aborts early into the dictionary fallback
+            async with asyncio.timeout(5.0):
+                response = await client.get(url, params=params)
+        response.raise_for_status()
+
+        # Decode the raw bytes with orjson instead of the stdlib parser
+        data = orjson.loads(response.content) if orjson is not None else response.json()
+
+        if data.get('responseStatus') == 200:
+            translated = data['responseData']['translatedText']
+            # Same-translation heuristic, casefolded as in the sync core
+            if len(translated) == len(text) and translated.casefold() == text.casefold():
+                translated = simple_translate(text, target_lang)
+            result = (translated, 0.8)
+        else:
+            result = (simple_translate(text, target_lang), 0.6)
+
+    except Exception as e:
+        if _is_timeout(e):
+            _note_upstream_timeout()
+        else:
+            # Surface non-timeout failures - a silent fallback here once
+            # masked a broken transport for entire processes
+            app.logger.warning(f"Async translation failed ({e!r}); using dictionary fallback")
+        # Ultimate fallback to simple translation
+        return simple_translate(text, target_lang), 0.5
+
+    _async_cache_put(key, result)
+    return result
+
+# Sentinel used to join/split batched texts in a single MyMemory query
+BATCH_SENTINEL = '\n§§§\n'
+
+async def translate_batch_async(texts, target_lang, source_lang='auto'):
+    """Translate a list of texts with a single upstream call.
+
+    Items are joined with a sentinel, sent as one MyMemory query and split
+    back out, amortizing the fixed round-trip over the whole batch. Cached
+    items are served locally; only misses go upstream."""
+    if source_lang == 'auto':
+        source_lang = 'en'  # Default to English if auto-detect
+
+    # Normalized views key the memo and the gate; the stripped originals
+    # keep their casing for the upstream query
+    stripped = [t.strip() for t in texts]
+    normalized = [t.lower() for t in stripped]
+    results = [None] * len(texts)
+
+    misses = []
+    for i, text in enumerate(normalized):
+        cached = _async_cache_get((text, source_lang, target_lang))
+        if cached is not None:
+            results[i] = cached
+        elif _dictionary_covers(text, target_lang):
+            # Known-phrase gate: answered locally, never sent upstream
+            results[i] = (simple_translate(text, target_lang), 0.9)
+        else:
+            misses.append(i)
+
+    if misses:
+        translated_parts = None
+        try:
+            url = "https://api.mymemory.translated.net/get"
+            params = {
+                'q': BATCH_SENTINEL.join(stripped[i] for i in misses),
+                'langpair': f'{source_lang}|{target_lang}'
+            }
+
+            client = _get_async_client()
+            if client is not None:
+                async with asyncio.timeout(5.0):
+                    response = await client.get(url, params=params)
+            else:
+                response = _get_session().get(url, params=params, timeout=(3.05, 4))
+            response.raise_for_status()
+
+            # Decode the raw bytes with orjson instead of the stdlib parser
+            data = orjson.loads(response.content) if orjson is not None else response.json()
+
+            if data.get('responseStatus') == 200:
+                # Split on the bare sentinel - upstream may reflow the
+                # whitespace around it
+                parts = [p.strip() for p in data['responseData']['translatedText'].split(BATCH_SENTINEL.strip())]
+                if len(parts) == len(misses):
+                    translated_parts = parts
+        except Exception as e:
+            if _is_timeout(e):
+                _note_upstream_timeout()
+            else:
+                # Keep batch degradation observable, same as the single path
+                app.logger.warning(f"Batch translation failed ({e!r}); using dictionary fallback")
+            translated_parts = None
+
+        for j, i in enumerate(misses):
+            if translated_parts is not None:
+                translated = translated_parts[j]
+                # Same-translation heuristic, casefolded as above
+                if len(translated) == len(stripped[i]) and translated.casefold() == stripped[i].casefold():
+                    translated = simple_translate(normalized[i], target_lang)
+                result = (translated, 0.8)
+                _async_cache_put((normalized[i], source_lang, target_lang), result)
+            else:
+                # Fallback to simple translation
+                result = (simple_translate(normalized[i], target_lang), 0.5)
+            results[i] = result
+
+    return [
+        {
+            'translated_text': translated,
             'source_lang': source_lang,
             'target_lang': target_lang,
-            'confidence': 0.5
+            'confidence': confidence
         }
+        for translated, confidence in results
+    ]
+
+# Basic translation dictionary for demo purposes - built once at import
+# time so per-call work is just lookups
+TRANSLATIONS = {
+    'es': {  # Spanish
+        'hello': 'hola',
+        'world': 'mundo',
+        'good morning': 'buenos días',
+        'good afternoon': 'buenas tardes',
+        'good evening': 'buenas noches',
+        'thank you': 'gracias',
+        'please': 'por favor',
+        'yes': 'sí',
+        'no': 'no',
+        'how are you': 'cómo estás',
+        'what is your name': 'cómo te llamas',
+        'my name is': 'mi nombre es',
+        'i love you': 'te amo',
+        'goodbye': 'adiós'
+    },
+    'fr': {  # French
+        'hello': 'bonjour',
+        'world': 'monde',
+        'good morning': 'bonjour',
+        'good afternoon': 'bon après-midi',
+        'good evening': 'bonsoir',
+        'thank you': 'merci',
+        'please': 's\'il vous plaît',
+        'yes': 'oui',
+        'no': 'non',
+        'how are you': 'comment allez-vous',
+        'goodbye': 'au revoir'
+    },
+    'de': {  # German
+        'hello': 'hallo',
+        'world': 'welt',
+        'good morning': 'guten morgen',
+        'thank you': 'danke',
+        'please': 'bitte',
+        'yes': 'ja',
+        'no': 'nein',
+        'goodbye': 'auf wiedersehen'
+    },
+    'it': {  # Italian
+        'hello': 'ciao',
+        'world': 'mondo',
+        'thank you': 'grazie',
+        'please': 'per favore',
+        'yes': 'sì',
+        'no': 'no',
+        'goodbye': 'arrivederci'
+    }
+}
+
+# Freeze the tables so the shared dicts are immutable and can never be
+# mutated (or shadowed by a per-call reallocation) at runtime
+TRANSLATIONS = types.MappingProxyType({
+    lang: types.MappingProxyType(lang_dict)
+    for lang, lang_dict in TRANSLATIONS.items()
+})
+
+# Phrases sorted longest-first, computed once, so the Python-level
+# fallback scan prefers the most specific match without re-sorting
+_TRANSLATION_ITEMS_BY_LEN = {
+    lang: sorted(lang_dict.items(), key=lambda kv: -len(kv[0]))
+    for lang, lang_dict in TRANSLATIONS.items()
+}
+
+# Pre-compiled alternation per language, longest phrase first so the
+# regex engine prefers the most specific match in one C-level sweep
+_PATTERNS = {
+    lang: re.compile('|'.join(re.escape(phrase) for phrase, _ in items))
+    for lang, items in _TRANSLATION_ITEMS_BY_LEN.items()
+}
+
+# Membership sets for the known-phrase gate: inputs the local dictionary
+# can fully answer never need the MyMemory round-trip
+_TRIVIAL_PHRASES = {
+    lang: frozenset(lang_dict)
+    for lang, lang_dict in TRANSLATIONS.items()
+}
+
+def _dictionary_covers(text, target_lang):
+    """Return True only when the local dictionary fully translates `text` -
+    every word falls inside a whole-word phrase match - so skipping the
+    upstream call loses nothing"""
+    phrases = _TRIVIAL_PHRASES.get(target_lang)
+    if not phrases:
+        return False
+    if text in phrases:
+        return True
+    matches = _dictionary_matches(text, target_lang)
+    if not matches:
+        return False
+    pos = 0
+    for start, end, _ in matches:
+        # Matches must align to word boundaries; "no" inside "nothing"
+        # covers nothing
+        if (start > 0 and text[start - 1].isalnum()) or \
+                (end + 1 < len(text) and text[end + 1].isalnum()):
+            return False
+        # Words left between matches mean the dictionary only partially
+        # translates the input - let the upstream API handle it; bare
+        # whitespace and punctuation are fine
+        if any(ch.isalnum() for ch in text[pos:start]):
+            return False
+        pos = end + 1
+    return not any(ch.isalnum() for ch in text[pos:])
+
+def _build_automaton(lang_dict):
+    """Compile a language dictionary into an Aho-Corasick automaton so all
+    phrases are matched in a single linear pass over the text"""
+    automaton = ahocorasick.Automaton()
+    for phrase, translation in lang_dict.items():
+        automaton.add_word(phrase, (phrase, translation))
+    automaton.make_automaton()
+    return automaton
+
+# Per-language automata, compiled once at import time
+if ahocorasick is not None:
+    AUTOMATA = {lang: _build_automaton(lang_dict) for lang, lang_dict in TRANSLATIONS.items()}
+else:
+    AUTOMATA = {}
+
+def _dictionary_matches(text_lower, target_lang):
+    """Non-overlapping dictionary phrase matches in `text_lower`, as
+    (start, end, translation) tuples with the longest match winning"""
+    automaton = AUTOMATA.get(target_lang)
+    if automaton is not None:
+        # One DFA traversal finds every phrase hit at once
+        matches = []
+        for end, (phrase, translation) in automaton.iter(text_lower):
+            matches.append((end - len(phrase) + 1, end, translation))
+        # Prefer the longest match at each position and skip overlaps
+        matches.sort(key=lambda m: (m[0], -(m[1] - m[0])))
+        selected = []
+        pos = 0
+        for start, end, translation in matches:
+            if start < pos:
+                continue
+            selected.append((start, end, translation))
+            pos = end + 1
+        return selected
 
+    # Regex fallback: the alternation is ordered longest-first, so
+    # finditer already yields non-overlapping longest matches
+    lang_dict = TRANSLATIONS[target_lang]
+    return [(m.start(), m.end() - 1, lang_dict[m.group(0)])
+            for m in _PATTERNS[target_lang].finditer(text_lower)]
+
+@functools.lru_cache(maxsize=4096)
 def simple_translate(text, target_lang):
     """Simple fallback translation using basic word replacements"""
-    # Basic translation dictionary for demo purposes
-    translations = {
-        'es': {  # Spanish
-            'hello': 'hola',
-            'world': 'mundo',
-            'good morning': 'buenos días',
-            'good afternoon': 'buenas tardes',
-            'good evening': 'buenas noches',
-            'thank you': 'gracias',
-            'please': 'por favor',
-            'yes': 'sí',
-            'no': 'no',
-            'how are you': 'cómo estás',
-            'what is your name': 'cómo te llamas',
-            'my name is': 'mi nombre es',
-            'i love you': 'te amo',
-            'goodbye': 'adiós'
-        },
-        'fr': {  # French
-            'hello': 'bonjour',
-            'world': 'monde',
-            'good morning': 'bonjour',
-            'good afternoon': 'bon après-midi',
-            'good evening': 'bonsoir',
-            'thank you': 'merci',
-            'please': 's\'il vous plaît',
-            'yes': 'oui',
-            'no': 'non',
-            'how are you': 'comment allez-vous',
-            'goodbye': 'au revoir'
-        },
-        'de': {  # German
-            'hello': 'hallo',
-            'world': 'welt',
-            'good morning': 'guten morgen',
-            'thank you': 'danke',
-            'please': 'bitte',
-            'yes': 'ja',
-            'no': 'nein',
-            'goodbye': 'auf wiedersehen'
-        },
-        'it': {  # Italian
-            'hello': 'ciao',
-            'world': 'mondo',
-            'thank you': 'grazie',
-            'please': 'per favore',
-            'yes': 'sì',
-            'no': 'no',
-            'goodbye': 'arrivederci'
-        }
-    }
-    
     text_lower = text.lower().strip()
-    
+
     # Check if we have a translation for this language
-    if target_lang in translations:
-        lang_dict = translations[target_lang]
+    if target_lang in TRANSLATIONS:
+        lang_dict = TRANSLATIONS[target_lang]
         # Check for exact match first
         if text_lower in lang_dict:
             return lang_dict[text_lower]
-        
-        # Check for partial matches
-        for eng_phrase, translation in lang_dict.items():
-            if eng_phrase in text_lower:
-                return text_lower.replace(eng_phrase, translation)
-    
+
+        matches = _dictionary_matches(text_lower, target_lang)
+        if matches:
+            # Splice all replacements in a single pass
+            pieces = []
+            pos = 0
+            for start, end, translation in matches:
+                pieces.append(text_lower[pos:start])
+                pieces.append(translation)
+                pos = end + 1
+            pieces.append(text_lower[pos:])
+            return ''.join(pieces)
+
     # If no translation found, return original with a note
     return f"{text} [translated to {target_lang}]"
 
@@ -156,7 +606,26 @@ SUPPORTED_LANGUAGES = {
 @app.route('/', methods=['GET'])
 def home():
     """Home endpoint with API information"""
-    return make_response(200, "Translation API is running!", {
+    return _static_json_response(_HOME_JSON, _HOME_ETAG)
+
+# Both / and /languages return constant data, so their bodies and ETags
+# are computed once; a conditional hit costs only a header comparison
+def _static_json_response(body, etag):
+    """Serve a constant JSON body with cache headers, honoring If-None-Match"""
+    # werkzeug parses If-None-Match (quoting, W/ prefixes, lists) and
+    # set_etag emits the RFC 7232 quoted form
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    else:
+        response = Response(body, status=200, mimetype='application/json')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'public, max-age=86400, immutable'
+    return response
+
+_HOME_JSON = _dumps({
+    "status": 200,
+    "message": "Translation API is running!",
+    "data": {
         "endpoints": {
             "/translate": "POST - Translate text",
             "/languages": "GET - Get supported languages"
@@ -170,35 +639,119 @@ def home():
             }
         },
         "total_languages": len(SUPPORTED_LANGUAGES)
-    })
+    }
+})
+# blake2s over sha256: faster, and this is a one-time compute anyway
+_HOME_ETAG = hashlib.blake2s(_HOME_JSON).hexdigest()
+
+# O(1) membership set and pre-rendered error message so invalid requests
+# don't pay a list allocation plus f-string formatting per hit
+_SUPPORTED_SET = frozenset(SUPPORTED_LANGUAGES)
+_INVALID_LANG_MSG = f"Invalid target language code. Supported: {sorted(_SUPPORTED_SET)}"
+
+# SUPPORTED_LANGUAGES is a constant, so the sorted views and the full
+# /languages payload can be built and serialized once at import time
+_LANGUAGE_LIST = sorted(
+    ({"code": code, "name": name} for code, name in SUPPORTED_LANGUAGES.items()),
+    key=lambda x: x['code']
+)
+_CODES_ONLY = sorted(SUPPORTED_LANGUAGES.keys())
+_LANGUAGES_JSON = _dumps({
+    "status": 200,
+    "message": "Supported languages retrieved successfully",
+    "data": {
+        "languages": _LANGUAGE_LIST,
+        "count": len(SUPPORTED_LANGUAGES),
+        "codes_only": _CODES_ONLY
+    }
+})
+_LANG_ETAG = hashlib.blake2s(_LANGUAGES_JSON).hexdigest()
 
 @app.route('/languages', methods=['GET'])
 def get_languages():
     """Get list of supported languages"""
-    language_list = []
-    for code, name in SUPPORTED_LANGUAGES.items():
-        language_list.append({
-            "code": code,
-            "name": name
-        })
-    
-    return make_response(200, "Supported languages retrieved successfully", {
-        "languages": sorted(language_list, key=lambda x: x['code']),
-        "count": len(SUPPORTED_LANGUAGES),
-        "codes_only": sorted(list(SUPPORTED_LANGUAGES.keys()))
+    # Serve the pre-serialized body directly, skipping jsonify entirely
+    return _static_json_response(_LANGUAGES_JSON, _LANG_ETAG)
+
+@app.route('/cache', methods=['GET'])
+def cache_stats():
+    """Debug endpoint exposing translation cache hit/miss/eviction stats"""
+    def info_to_dict(info):
+        return {
+            "hits": info.hits,
+            "misses": info.misses,
+            "maxsize": info.maxsize,
+            "currsize": info.currsize
+        }
+
+    return make_response(200, "Cache statistics retrieved successfully", {
+        "translate_cache": info_to_dict(_translate_cached.cache_info()),
+        "simple_translate_cache": info_to_dict(simple_translate.cache_info()),
+        "async_translate_cache": {
+            "currsize": len(_ASYNC_CACHE),
+            "maxsize": getattr(_ASYNC_CACHE, 'maxsize', 4096)
+        }
     })
 
+@app.route('/cache/invalidate', methods=['POST'])
+def invalidate_cache():
+    """Evict a single translation from the caches, e.g. after a bad
+    upstream result, so it is re-fetched on the next request"""
+    if not request.is_json:
+        return make_response(400, "Request must be JSON", None)
+
+    try:
+        if orjson is not None:
+            request_data = orjson.loads(request.get_data())
+        else:
+            request_data = request.get_json()
+    except Exception:
+        return make_response(400, "Request body must be valid JSON", None)
+
+    if not isinstance(request_data, dict) or 'text' not in request_data:
+        return make_response(400, "Missing 'text' field", None)
+
+    text = str(request_data['text']).strip().lower()
+    target_lang = request_data.get('target_lang', 'en').lower()
+    source_lang = request_data.get('source_lang', 'en').lower()
+    if source_lang == 'auto':
+        source_lang = 'en'
+
+    removed = 0
+    with _CACHE_LOCK:
+        if _TRANSLATE_CACHE is not None:
+            if _TRANSLATE_CACHE.pop(hashkey(text, source_lang, target_lang), None) is not None:
+                removed += 1
+        else:
+            # lru_cache has no per-key eviction; drop everything
+            _translate_cached.cache_clear()
+        if _ASYNC_CACHE.pop((text, source_lang, target_lang), None) is not None:
+            removed += 1
+
+    return make_response(200, "Cache invalidated", {"removed_entries": removed})
+
 @app.route('/translate', methods=['POST'])
-def translate_endpoint():
+async def translate_endpoint():
     """Main translation endpoint"""
     app.logger.info("Received translation request")
     
     # Validate input format
     if not request.is_json:
         return make_response(400, "Request must be JSON", None)
-    
-    request_data = request.get_json()
-    
+
+    # Decode the raw body with orjson when available, skipping Flask's
+    # stdlib-json parse
+    try:
+        if orjson is not None:
+            request_data = orjson.loads(request.get_data())
+        else:
+            request_data = request.get_json()
+    except Exception:
+        return make_response(400, "Request body must be valid JSON", None)
+
+    if not isinstance(request_data, dict):
+        return make_response(400, "Request body must be a JSON object", None)
+
     # Validate required fields
     if 'text' not in request_data:
         return make_response(400, "Missing 'text' field", None)
@@ -207,46 +760,81 @@ def translate_endpoint():
     target_language = request_data.get('target_language', 'en').lower()
     source_language = request_data.get('source_language', 'auto').lower()
     
-    # Validate text content
-    if not isinstance(text, str) or not text.strip():
+    # Validate text content - a single string or a batch of strings
+    if isinstance(text, list):
+        if not text or not all(isinstance(item, str) and item.strip() for item in text):
+            return make_response(400, "Text list must contain only non-empty strings", None)
+    elif not isinstance(text, str) or not text.strip():
         return make_response(400, "Text must be a non-empty string", None)
     
     # Validate language codes
-    if target_language not in SUPPORTED_LANGUAGES:
-        return make_response(400, f"Invalid target language code. Supported: {list(SUPPORTED_LANGUAGES.keys())}", None)
+    if target_language not in _SUPPORTED_SET:
+        return make_response(400, _INVALID_LANG_MSG, None)
     
     # Perform translation
     try:
-        app.logger.info(f"Translating text: '{text}' to {target_language}")
-        
-        # Use translation function (now with fallback handling)
-        translation_result = translate_text(text, target_language, source_language)
-        
-        # Create response
-        result = {
-            "original_text": text,
-            "translated_text": translation_result['translated_text'],
-            "source_language": {
-                "code": translation_result['source_lang'],
-                "name": SUPPORTED_LANGUAGES.get(translation_result['source_lang'], translation_result['source_lang'])
-            },
-            "target_language": {
-                "code": target_language,
-                "name": SUPPORTED_LANGUAGES[target_language]
-            },
-            "confidence": translation_result['confidence'],
-            "service": "MyMemory API with fallback",
-            "note": "Using hybrid translation service for demo purposes"
-        }
+        # Guard so the f-string isn't built when INFO is disabled
+        if app.logger.isEnabledFor(logging.INFO):
+            app.logger.info(f"Translating text: '{text}' to {target_language}")
+
+        # Batch request: one upstream call covers the whole list
+        if isinstance(text, list):
+            batch_results = await translate_batch_async(text, target_language, source_language)
+            result = {
+                "original_text": text,
+                "translations": [
+                    {
+                        "original_text": original,
+                        "translated_text": item['translated_text'],
+                        "confidence": item['confidence']
+                    }
+                    for original, item in zip(text, batch_results)
+                ],
+                "source_language": {
+                    "code": batch_results[0]['source_lang'],
+                    "name": SUPPORTED_LANGUAGES.get(batch_results[0]['source_lang'], batch_results[0]['source_lang'])
+                },
+                "target_language": {
+                    "code": target_language,
+                    "name": SUPPORTED_LANGUAGES[target_language]
+                },
+                "service": "MyMemory API with fallback",
+                "note": "Batched translation - one upstream call for the whole list"
+            }
+            app.logger.info("Batch translation successful")
+            return make_response(200, "Translation successful", result)
+
+        # Use translation function (now with fallback handling); prefer the
+        # async client so the event loop isn't blocked on the upstream RTT
+        if _get_async_client() is not None:
+            translation_result = await translate_text_async(text, target_language, source_language)
+        else:
+            translation_result = translate_text(text, target_language, source_language)
         
+        # Create response by filling the fixed-shape template; only the
+        # variable fields pay for JSON encoding
+        source_lang = translation_result['source_lang']
+        body = _TRANSLATE_RESP_TMPL.format(
+            original_text=json.dumps(text),
+            translated_text=json.dumps(translation_result['translated_text']),
+            source_code=json.dumps(source_lang),
+            source_name=json.dumps(SUPPORTED_LANGUAGES.get(source_lang, source_lang)),
+            target_code=json.dumps(target_language),
+            target_name=json.dumps(SUPPORTED_LANGUAGES[target_language]),
+            confidence=translation_result['confidence']
+        )
+
         app.logger.info("Translation successful")
-        return make_response(200, "Translation successful", result)
+        return Response(body, status=200, mimetype='application/json')
     
     except Exception as e:
         app.logger.error(f"Translation failed: {str(e)}")
         # Even if there's an error, try to provide a basic response
         try:
-            fallback_translation = simple_translate(text, target_language)
+            if isinstance(text, list):
+                fallback_translation = [simple_translate(item, target_language) for item in text]
+            else:
+                fallback_translation = simple_translate(text, target_language)
             result = {
                 "original_text": text,
                 "translated_text": fallback_translation,
@@ -0,0 +1,18 @@
+"""Gunicorn entry point with gevent monkey patching.
+
+The monkey patch must run before Flask/requests are imported so their
+sockets become greenlet-aware, letting one worker multiplex many
+concurrent MyMemory calls while they wait on network I/O.
+
+Run with:
+    gunicorn -k gevent -w 4 --worker-connections 1000 wsgi:app
+"""
+from gevent import monkey
+monkey.patch_all()
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'api'))
+
+from index import app  # noqa: E402